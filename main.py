@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import signal
 import os
 import sys
@@ -11,6 +12,14 @@ from src.core.order_cleanup import OrderCleanup
 from src.core.user_stream import UserDataStream
 from src.utils.utils import log
 
+# None of the bot's log formats use caller, thread or process fields, so skip
+# collecting them for every record (findCaller walks the stack each time).
+# Set here rather than in the logger module so the API server keeps them.
+logging._srcfile = None
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Import PositionMonitor if enabled
 position_monitor = None
 if config.GLOBAL_SETTINGS.get('use_position_monitor', False):
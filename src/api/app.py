@@ -9,8 +9,14 @@ import sys
 import threading
 
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path to allow imports when run as script
 parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if parent_dir not in sys.path:
@@ -34,6 +40,21 @@ from src.api.routes.health_routes import health_bp
 # Initialize monitoring service (starts the monitoring thread)
 import src.api.services.monitoring_service
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, falling back to Flask's default() for other types."""
+
+    def dumps(self, obj, **kwargs):
+        # Pass datetimes through to default() so they keep Flask's HTTP date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app():
     """Create and configure the Flask application."""
     # Configure Flask with proper template and static paths
@@ -42,6 +63,10 @@ def create_app():
                 static_folder=static_dir)
     CORS(app)
 
+    # Use orjson for request/response JSON when it is installed
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
     # Register all blueprints
     app.register_blueprint(setup_bp)
     app.register_blueprint(exchange_bp)
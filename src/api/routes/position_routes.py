@@ -2,161 +2,323 @@
 Position detail routes.
 """
 
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
 from flask import Blueprint, jsonify, request
 from src.api.config import API_KEY, API_SECRET
-from src.api.services.database_service import get_db_connection
-from src.utils.auth import make_authenticated_request
+from src.api.services.database_service import db_conn
+from src.database.db import insert_trade
+from src.utils.auth import make_authenticated_request, HTTP_POOL_MAXSIZE
+from src.utils.config import config
 import time
 
 position_bp = Blueprint('position', __name__)
 
+# Shared pool for firing independent exchange requests concurrently. It is sized
+# to the HTTP connection pool so that overlapping dashboard polls (two upstream
+# calls each) never queue behind one another for a worker thread.
+_http_pool = ThreadPoolExecutor(max_workers=HTTP_POOL_MAXSIZE, thread_name_prefix='position-http')
+# Seconds to wait for a pooled exchange request before giving up on it
+HTTP_RESULT_TIMEOUT = 15
+
+# Short-lived cache of /fapi/v2/positionRisk shared by dashboard polls
+POSITION_RISK_TTL = 2
+# Seconds allowed for the positionRisk request itself, and for a dashboard
+# poll to wait on another poll's in-flight request before making its own
+POSITION_RISK_TIMEOUT = 10
+_position_risk_cache = {'risk': None, 'expires_at': 0}
+_position_risk_lock = threading.Lock()
+
+# Maximum number of orders accepted by a single /fapi/v1/batchOrders call
+BATCH_ORDER_LIMIT = 5
+
+# Order side that opens a position on each position side
+POSITION_ENTRY_SIDES = {'LONG': 'BUY', 'SHORT': 'SELL'}
+
+# Dashboard category for child (TP/SL) trades, keyed by order type
+TRADE_CATEGORIES = {
+    'TAKE_PROFIT_MARKET': 'TAKE_PROFIT',
+    'STOP_MARKET': 'STOP_LOSS',
+}
+
+# Columns of order_relationships returned to the dashboard
+ORDER_RELATIONSHIP_COLUMNS = (
+    'id', 'main_order_id', 'tp_order_id', 'sl_order_id', 'symbol',
+    'position_side', 'tranche_id', 'created_at'
+)
+
+# SQL used by get_position_details. Keeping the text identical between requests
+# lets each pooled connection's statement cache reuse the prepared statements;
+# the *_TMPL queries are formatted with one '?' per IN (...) element.
+_SQL_HAS_TRANCHES = '''
+    SELECT name FROM sqlite_master
+    WHERE type='table' AND name='position_tranches'
+'''
+
+_SQL_TRANCHES = '''
+    SELECT pt.*,
+           COALESCE(MAX(t.filled_qty), 0) as filled_qty,
+           COALESCE(MAX(t.avg_price), pt.avg_entry_price) as actual_entry_price,
+           SUM(pt.total_quantity) OVER () as total_qty_sum,
+           SUM(pt.avg_entry_price * pt.total_quantity) OVER () as weighted_entry_sum
+    FROM position_tranches pt
+    LEFT JOIN trades t ON t.tranche_id = pt.tranche_id
+                      AND t.order_type = 'LIMIT'
+                      AND t.parent_order_id IS NULL
+    WHERE pt.symbol = ? AND pt.position_side = ?
+    GROUP BY pt.tranche_id
+    ORDER BY pt.tranche_id ASC
+'''
+
+# SQLite returns the bare columns from the row holding MAX(created_at)
+_SQL_TRANCHE_RELS_TMPL = '''
+    SELECT tranche_id, tp_order_id, sl_order_id, MAX(created_at) as created_at
+    FROM order_relationships
+    WHERE symbol = ? AND position_side = ? AND tranche_id IN ({placeholders})
+    AND (tp_order_id IS NOT NULL OR sl_order_id IS NOT NULL)
+    GROUP BY tranche_id
+'''
+
+_SQL_TRADES = '''
+    SELECT id, timestamp, symbol, order_id, side, qty, price, status, order_type,
+           parent_order_id, exchange_trade_id, realized_pnl, commission,
+           filled_qty, avg_price, tranche_id
+    FROM trades
+    WHERE symbol = ? AND side = ?
+    ORDER BY timestamp DESC
+    LIMIT 100
+'''
+
+_SQL_RELS_AND_STATUSES_TMPL = '''
+    WITH rels AS (
+        SELECT * FROM order_relationships
+        WHERE symbol = ? AND position_side = ?
+    ),
+    statuses AS (
+        SELECT order_id, symbol, side, quantity, price, position_side, status
+        FROM order_status
+        WHERE symbol = ?
+        AND (order_id IN (SELECT tp_order_id FROM rels)
+             OR order_id IN (SELECT sl_order_id FROM rels)
+             OR order_id IN ({placeholders}))
+    )
+    SELECT 'rel' AS tag, id, main_order_id, tp_order_id, sl_order_id, symbol,
+           position_side, tranche_id, created_at,
+           NULL AS order_id, NULL AS side, NULL AS quantity, NULL AS price, NULL AS status
+    FROM rels
+    UNION ALL
+    SELECT 'status', NULL, NULL, NULL, NULL, symbol,
+           position_side, NULL, NULL,
+           order_id, side, quantity, price, status
+    FROM statuses
+    ORDER BY tag, created_at DESC
+'''
+
+
+@dataclass
+class OrderStatus:
+    """Status of a TP/SL order as reported to the dashboard (serialized by jsonify)."""
+    __slots__ = ('order_id', 'status', 'quantity', 'price', 'side', 'type', 'executed_qty')
+    order_id: str
+    status: str
+    quantity: float
+    price: Any
+    side: str
+    type: str
+    executed_qty: float
+
+
+# Whether the position_tranches table exists; only a positive probe is cached
+# since the bot process may create the table after the API server starts
+_HAS_POSITION_TRANCHES = None
+
+
+def _has_tranches(conn):
+    """Check (once) whether the position_tranches table exists."""
+    global _HAS_POSITION_TRANCHES
+    if _HAS_POSITION_TRANCHES:
+        return True
+
+    cursor = conn.execute(_SQL_HAS_TRANCHES)
+    _HAS_POSITION_TRANCHES = cursor.fetchone() is not None
+    return _HAS_POSITION_TRANCHES
+
+
+def _request_position_risk():
+    """Fetch /fapi/v2/positionRisk upstream and refresh the cache with the result."""
+    response = make_authenticated_request(
+        'GET', 'https://fapi.asterdex.com/fapi/v2/positionRisk', timeout=POSITION_RISK_TIMEOUT)
+    if response.status_code != 200:
+        return None, response.status_code
+
+    positions = response.json()
+    risk = {
+        'raw': positions,
+        'by_key': {
+            (p['symbol'], p.get('positionSide', 'BOTH')): p
+            for p in positions if float(p.get('positionAmt', 0)) != 0
+        }
+    }
+    _position_risk_cache['risk'] = risk
+    _position_risk_cache['expires_at'] = time.time() + POSITION_RISK_TTL
+    return risk, 200
+
+def _fetch_position_risk(force_refresh=False):
+    """
+    Fetch all positions from /fapi/v2/positionRisk, reusing a recent response.
+
+    The lock only collapses concurrent cache misses from dashboard polls onto
+    a single upstream request. force_refresh callers (closing positions) go
+    straight upstream without taking it, so they never queue behind a slow
+    poll, and a poll that can't get the lock in time makes its own request.
+    Returns a (risk, status_code) tuple where risk is a dict holding the raw
+    position list under 'raw' and the open positions indexed by
+    (symbol, positionSide) under 'by_key'; risk is None on failure.
+    """
+    if force_refresh:
+        return _request_position_risk()
+
+    if not _position_risk_lock.acquire(timeout=POSITION_RISK_TIMEOUT):
+        return _request_position_risk()
+    try:
+        if _position_risk_cache['risk'] is not None and time.time() < _position_risk_cache['expires_at']:
+            return _position_risk_cache['risk'], 200
+        return _request_position_risk()
+    finally:
+        _position_risk_lock.release()
+
+def _lookup_position(by_key, symbol, side):
+    """
+    Find the open position for a symbol/side in a positionRisk index.
+
+    Hedge-mode positions are keyed by their own side, while one-way mode
+    positions live under BOTH regardless of direction.
+    """
+    if side == 'BOTH':
+        return (by_key.get((symbol, 'BOTH')) or by_key.get((symbol, 'LONG'))
+                or by_key.get((symbol, 'SHORT')))
+    return by_key.get((symbol, side)) or by_key.get((symbol, 'BOTH'))
+
 @position_bp.route('/api/positions/<symbol>/<side>')
 def get_position_details(symbol, side):
     """Get detailed position information including tranches and orders."""
-    conn = get_db_connection()
+    # Fire both exchange requests up front so they run while we query the database
+    position_risk_future = _http_pool.submit(_fetch_position_risk)
+    open_orders_future = None
+    if API_KEY and API_SECRET:
+        open_orders_future = _http_pool.submit(
+            make_authenticated_request, 'GET', 'https://fapi.asterdex.com/fapi/v1/openOrders', {'symbol': symbol})
+
+    with db_conn() as conn:
+
+        # Get tranche data from database for detailed breakdown
+        if _has_tranches(conn):
+            # Get all tranches for this position with their TP/SL orders
+            # First get tranches from position_tranches table
+            cursor = conn.execute(_SQL_TRANCHES, (symbol, side))
+
+            # Build tranche dicts straight off the cursor in a single pass
+            tranches = []
+            tranche_totals = (0, 0)
+            for row in cursor:
+                tranche = dict(row)
+                # Position-wide totals are repeated on every row; keep them out of the tranche payload
+                tranche_totals = (tranche.pop('total_qty_sum'), tranche.pop('weighted_entry_sum'))
+                tranches.append(tranche)
+
+            # Also get TP/SL orders from order_relationships for all tranches in one query
+            # This will capture TP/SL orders that might not be in position_tranches
+            if tranches:
+                tranche_ids = [t['tranche_id'] for t in tranches]
+
+                # Get the most recent TP/SL orders per tranche from order_relationships
+                cursor = conn.execute(
+                    _SQL_TRANCHE_RELS_TMPL.format(placeholders=','.join('?' * len(tranche_ids))),
+                    [symbol, side] + tranche_ids)
+
+                rel_by_tranche = {row['tranche_id']: row for row in cursor}
+
+                for tranche in tranches:
+                    rel_row = rel_by_tranche.get(tranche['tranche_id'])
+                    if rel_row:
+                        # Update with order_relationships data if not already set
+                        if not tranche.get('tp_order_id') and rel_row['tp_order_id']:
+                            tranche['tp_order_id'] = rel_row['tp_order_id']
+                        if not tranche.get('sl_order_id') and rel_row['sl_order_id']:
+                            tranche['sl_order_id'] = rel_row['sl_order_id']
+        else:
+            tranches = []
+            tranche_totals = (0, 0)
+
+        # Get all trade entries for this position (entries are BUYs for longs, SELLs for shorts)
+        trades = []
+        trade_side = POSITION_ENTRY_SIDES.get(side)
+        if trade_side:
+            cursor = conn.execute(_SQL_TRADES, (symbol, trade_side))
+
+            for row in cursor:
+                trade = dict(row)
+                if trade['parent_order_id'] is None:
+                    trade['trade_category'] = 'ENTRY'
+                else:
+                    trade['trade_category'] = TRADE_CATEGORIES.get(trade['order_type'], trade['order_type'])
+                trades.append(trade)
+
+        # Get all related orders from order_relationships together with the stored
+        # status of every TP/SL order referenced by them or by the tranches, as one
+        # compound statement. Rows are told apart by their tag column.
+        tranche_order_ids = [str(t[key]) for t in tranches
+                             for key in ('tp_order_id', 'sl_order_id') if t.get(key)]
+        cursor = conn.execute(
+            _SQL_RELS_AND_STATUSES_TMPL.format(placeholders=','.join('?' * len(tranche_order_ids))),
+            [symbol, side, symbol] + tranche_order_ids)
+
+        order_relationships = []
+        db_orders = []
+        for row in cursor:
+            if row['tag'] == 'rel':
+                order_relationships.append({key: row[key] for key in ORDER_RELATIONSHIP_COLUMNS})
+            else:
+                db_orders.append(row)
 
     # Get exchange position data for consistent PNL calculation with main dashboard
     exchange_position = None
     try:
-        response = make_authenticated_request('GET', f'https://fapi.asterdex.com/fapi/v2/positionRisk')
-        if response.status_code == 200:
-            positions = response.json()
+        risk, _ = position_risk_future.result(timeout=HTTP_RESULT_TIMEOUT)
+        if risk is not None:
             # Find the specific position
-            exchange_position = next((p for p in positions if p['symbol'] == symbol and float(p.get('positionAmt', 0)) != 0), None)
+            exchange_position = _lookup_position(risk['by_key'], symbol, side)
     except Exception as e:
         # print(f"Error fetching exchange position for {symbol}: {e}")
         pass
 
-    # Get tranche data from database for detailed breakdown
-    # Check if position_tranches table exists
-    cursor = conn.execute('''
-        SELECT name FROM sqlite_master
-        WHERE type='table' AND name='position_tranches'
-    ''')
-
-    if cursor.fetchone():
-        # Get all tranches for this position with their TP/SL orders
-        # First get tranches from position_tranches table
-        cursor = conn.execute('''
-            SELECT pt.*,
-                   COALESCE(MAX(t.filled_qty), 0) as filled_qty,
-                   COALESCE(MAX(t.avg_price), pt.avg_entry_price) as actual_entry_price
-            FROM position_tranches pt
-            LEFT JOIN trades t ON t.tranche_id = pt.tranche_id
-                              AND t.order_type = 'LIMIT'
-                              AND t.parent_order_id IS NULL
-            WHERE pt.symbol = ? AND pt.position_side = ?
-            GROUP BY pt.tranche_id
-            ORDER BY pt.tranche_id ASC
-        ''', (symbol, side))
-
-        tranches = [dict(row) for row in cursor.fetchall()]
-
-        # Also get TP/SL orders from order_relationships for each tranche
-        # This will capture TP/SL orders that might not be in position_tranches
+    # If we have exchange position data, don't calculate tranche-level PNL
+    # since the exchange provides accurate total PNL only
+    if exchange_position:
+        # Set tranche pnl to 0 since we can't accurately distribute total exchange PNL across tranches
         for tranche in tranches:
-            tranche_id = tranche.get('tranche_id')
-
-            # Get the most recent TP/SL orders for this tranche from order_relationships
-            cursor = conn.execute('''
-                SELECT tp_order_id, sl_order_id
-                FROM order_relationships
-                WHERE symbol = ? AND position_side = ? AND tranche_id = ?
-                AND (tp_order_id IS NOT NULL OR sl_order_id IS NOT NULL)
-                ORDER BY created_at DESC
-                LIMIT 1
-            ''', (symbol, side, tranche_id))
-
-            rel_row = cursor.fetchone()
-            if rel_row:
-                rel_dict = dict(rel_row)
-                # Update with order_relationships data if not already set
-                if not tranche.get('tp_order_id') and rel_dict.get('tp_order_id'):
-                    tranche['tp_order_id'] = rel_dict['tp_order_id']
-                if not tranche.get('sl_order_id') and rel_dict.get('sl_order_id'):
-                    tranche['sl_order_id'] = rel_dict['sl_order_id']
-
-        # If we have exchange position data, don't calculate tranche-level PNL
-        # since the exchange provides accurate total PNL only
-        if exchange_position:
-            # Set tranche pnl to 0 since we can't accurately distribute total exchange PNL across tranches
-            for tranche in tranches:
-                tranche['unrealized_pnl'] = 0.0
-    else:
-        tranches = []
-
-    # Get all trade entries for this position
-    cursor = conn.execute('''
-        SELECT t.*,
-               CASE
-                   WHEN t.parent_order_id IS NULL THEN 'ENTRY'
-                   WHEN t.order_type = 'TAKE_PROFIT_MARKET' THEN 'TAKE_PROFIT'
-                   WHEN t.order_type = 'STOP_MARKET' THEN 'STOP_LOSS'
-                   ELSE t.order_type
-               END as trade_category
-        FROM trades t
-        WHERE t.symbol = ?
-        AND ((t.side = 'BUY' AND ? = 'LONG') OR (t.side = 'SELL' AND ? = 'SHORT'))
-        ORDER BY t.timestamp DESC
-        LIMIT 100
-    ''', (symbol, side, side))
-
-    trades = [dict(row) for row in cursor.fetchall()]
-
-    # Get all related orders from order_relationships first (moved up)
-    cursor = conn.execute('''
-        SELECT * FROM order_relationships
-        WHERE symbol = ? AND (position_side = ? OR position_side IS NULL)
-        ORDER BY created_at DESC
-    ''', (symbol, side))
-
-    all_order_rels = [dict(row) for row in cursor.fetchall()]
-
-    # Filter relationships based on side
-    order_relationships = []
-    for rel in all_order_rels:
-        # Check if position_side column exists
-        if 'position_side' in rel:
-            if rel['position_side'] == side:
-                order_relationships.append(rel)
-        else:
-            # If no position_side column, include all for the symbol
-            order_relationships.append(rel)
+            tranche['unrealized_pnl'] = 0.0
 
     # Get current order status for all orders from exchange API
     order_statuses = {}
 
     # First, collect all TP/SL order IDs from tranches and relationships
     # This needs to happen before we check open orders
-    tp_sl_order_ids = set()
-    tp_order_ids = set()  # Track specifically which are TP orders
-    sl_order_ids = set()  # Track specifically which are SL orders
-
-    for tranche in tranches:
-        if tranche.get('tp_order_id'):
-            order_id = str(tranche['tp_order_id'])
-            tp_sl_order_ids.add(order_id)
-            tp_order_ids.add(order_id)
-        if tranche.get('sl_order_id'):
-            order_id = str(tranche['sl_order_id'])
-            tp_sl_order_ids.add(order_id)
-            sl_order_ids.add(order_id)
-
-    for rel in order_relationships:
-        if rel.get('tp_order_id'):
-            order_id = str(rel['tp_order_id'])
-            tp_sl_order_ids.add(order_id)
-            tp_order_ids.add(order_id)
-        if rel.get('sl_order_id'):
-            order_id = str(rel['sl_order_id'])
-            tp_sl_order_ids.add(order_id)
-            sl_order_ids.add(order_id)
+    tp_order_ids = {str(o['tp_order_id']) for o in chain(tranches, order_relationships)
+                    if o.get('tp_order_id')}  # Track specifically which are TP orders
+    sl_order_ids = {str(o['sl_order_id']) for o in chain(tranches, order_relationships)
+                    if o.get('sl_order_id')}  # Track specifically which are SL orders
+    tp_sl_order_ids = tp_order_ids | sl_order_ids
 
     if API_KEY and API_SECRET:
         try:
             # Get currently open orders
             try:
-                response = make_authenticated_request('GET', 'https://fapi.asterdex.com/fapi/v1/openOrders', {'symbol': symbol})
+                response = open_orders_future.result(timeout=HTTP_RESULT_TIMEOUT)
                 if response.status_code == 200:
                     open_orders_data = response.json()
                     # Process all orders, checking if they're TP/SL orders
@@ -180,15 +342,15 @@ def get_position_details(symbol, side):
                             else:
                                 effective_type = order_type
 
-                            order_statuses[order_id] = {
-                                'order_id': order_id,
-                                'status': order_status,
-                                'quantity': float(order.get('origQty', 0)),
-                                'price': order.get('price') or order.get('stopPrice'),
-                                'side': order.get('side'),
-                                'type': effective_type,
-                                'executed_qty': float(order.get('executedQty', 0))
-                            }
+                            order_statuses[order_id] = OrderStatus(
+                                order_id=order_id,
+                                status=order_status,
+                                quantity=float(order.get('origQty', 0)),
+                                price=order.get('price') or order.get('stopPrice'),
+                                side=order.get('side'),
+                                type=effective_type,
+                                executed_qty=float(order.get('executedQty', 0))
+                            )
                 else:
                     # print(f"Error fetching open orders: {response.status_code}")
                     pass
@@ -198,19 +360,12 @@ def get_position_details(symbol, side):
                 pass
 
             # For orders not in the open orders list, check if they exist in order_status table
-            if tp_sl_order_ids:
-                cursor = conn.execute('''
-                    SELECT order_id, symbol, side, quantity, price, position_side, status
-                    FROM order_status
-                    WHERE symbol = ? AND order_id IN ({})
-                '''.format(','.join(['?' for _ in tp_sl_order_ids])),
-                [symbol] + list(tp_sl_order_ids))
-
-                db_orders = cursor.fetchall()
+            # (their rows were fetched alongside the order relationships above)
+            missing_order_ids = tp_sl_order_ids - order_statuses.keys()
+            if missing_order_ids:
                 for order_row in db_orders:
-                    order_dict = dict(order_row)
-                    order_id = str(order_dict['order_id'])
-                    if order_id not in order_statuses:
+                    order_id = str(order_row['order_id'])
+                    if order_id in missing_order_ids:
                         # Determine type based on whether it's a TP or SL order
                         if order_id in tp_order_ids:
                             order_type = 'TP_ORDER'
@@ -219,15 +374,15 @@ def get_position_details(symbol, side):
                         else:
                             order_type = 'TP/SL'
 
-                        order_statuses[order_id] = {
-                            'order_id': order_id,
-                            'status': order_dict.get('status', 'UNKNOWN'),
-                            'quantity': float(order_dict.get('quantity', 0)),
-                            'price': order_dict.get('price'),
-                            'side': order_dict.get('side'),
-                            'type': order_type,
-                            'executed_qty': 0
-                        }
+                        order_statuses[order_id] = OrderStatus(
+                            order_id=order_id,
+                            status=order_row['status'] or 'UNKNOWN',
+                            quantity=float(order_row['quantity'] or 0),
+                            price=order_row['price'],
+                            side=order_row['side'],
+                            type=order_type,
+                            executed_qty=0
+                        )
 
             # if not order_statuses:
             #     print(f"No TP/SL orders found for {symbol}")
@@ -258,21 +413,17 @@ def get_position_details(symbol, side):
         total_margin = float(exchange_position.get('initialMargin', 0))
     elif tranches:
         # Fallback to tranche calculations if exchange data unavailable
-        total_quantity = sum(t['total_quantity'] for t in tranches)
+        total_quantity, weighted_entry_sum = tranche_totals
         if total_quantity > 0:
-            avg_entry_price = sum(t['avg_entry_price'] * t['total_quantity'] for t in tranches) / total_quantity
+            avg_entry_price = weighted_entry_sum / total_quantity
         else:
             avg_entry_price = 0
         total_unrealized_pnl = sum(t.get('unrealized_pnl', 0) for t in tranches)
 
         # Calculate total margin based on leverage from config
-        leverage = 10  # Default, should get from config
-        try:
-            from src.utils.config import config
-            if symbol in config.SYMBOL_SETTINGS:
-                leverage = config.SYMBOL_SETTINGS[symbol].get('leverage', 10)
-        except:
-            pass
+        leverage = 10  # Default when the symbol is not configured
+        if symbol in config.SYMBOL_SETTINGS:
+            leverage = config.SYMBOL_SETTINGS[symbol].get('leverage', 10)
         total_margin = (total_quantity * avg_entry_price) / leverage if leverage > 0 else 0
     else:
         # No position data
@@ -281,8 +432,6 @@ def get_position_details(symbol, side):
         total_unrealized_pnl = 0
         total_margin = 0
 
-    conn.close()
-
     return jsonify({
         'symbol': symbol,
         'side': side,
@@ -301,35 +450,88 @@ def get_position_details(symbol, side):
         'current_positions': []
     })
 
+def _find_close_target(by_key, symbol, side):
+    """Find the open position to close, making sure its direction matches a LONG/SHORT side."""
+    target_position = _lookup_position(by_key, symbol, side)
+    if target_position and side != 'BOTH':
+        # If we specified a specific side, make sure the position direction matches it
+        current_side = 'LONG' if float(target_position.get('positionAmt', 0)) > 0 else 'SHORT'
+        if current_side != side:
+            return None
+    return target_position
+
+def _parse_close_targets(body):
+    """
+    Validate a close_all request body.
+
+    Returns (targets, error): targets is None when the body explicitly asks to
+    close every position, otherwise a list of (symbol, side) pairs.
+    """
+    if not isinstance(body, dict):
+        return None, 'JSON body with "targets" or "all": true required'
+
+    if body.get('all') is True:
+        if 'targets' in body:
+            return None, 'Specify either "targets" or "all", not both'
+        return None, None
+
+    targets = body.get('targets')
+    if not isinstance(targets, list) or not targets:
+        return None, '"targets" must be a non-empty list of {"symbol", "side"} objects'
+
+    parsed = []
+    for target in targets:
+        if not isinstance(target, dict):
+            return None, f'Invalid target: {target!r}'
+        symbol = target.get('symbol')
+        side = target.get('side')
+        if not isinstance(symbol, str) or not symbol or side not in ('LONG', 'SHORT', 'BOTH'):
+            return None, f'Invalid target: {target!r}'
+        parsed.append((symbol, side))
+    return parsed, None
+
+def _build_close_order(position):
+    """Build the market order that closes a positionRisk entry."""
+    position_amt = float(position.get('positionAmt', 0))
+    position_side = position.get('positionSide', 'BOTH')
+
+    # Close in the opposite direction of the position
+    order_data = {
+        'symbol': position['symbol'],
+        'side': 'SELL' if position_amt > 0 else 'BUY',
+        'type': 'MARKET',
+        'quantity': str(abs(position_amt)),
+        'positionSide': position_side
+    }
+
+    # Only add reduceOnly in one-way mode (positionSide = BOTH)
+    if position_side == 'BOTH':
+        order_data['reduceOnly'] = 'true'
+
+    return order_data
+
+def _log_close_trade(order_data, order_result):
+    """Record a placed close order in the trades table (similar to how trader.py logs orders)."""
+    try:
+        quantity = float(order_data['quantity'])
+        with db_conn() as conn:
+            insert_trade(conn, order_data['symbol'], str(order_result.get('orderId', 'unknown')),
+                         order_data['side'], quantity, 0, 'SUCCESS', json.dumps(order_result), 'MARKET', None,
+                         filled_qty=quantity, avg_price=order_result.get('avgPrice', 0))
+    except Exception as e:
+        print(f"Error logging close position trade: {e}")
+
 @position_bp.route('/api/positions/<symbol>/<side>/close', methods=['POST'])
 def close_position(symbol, side):
     """Close a position by placing a market order in the opposite direction."""
     try:
-        # Get current position data from exchange
-        response = make_authenticated_request('GET', f'https://fapi.asterdex.com/fapi/v2/positionRisk')
-        if response.status_code != 200:
-            return jsonify({'error': f'Failed to fetch position data: {response.status_code}', 'success': False}), response.status_code
+        # Get current position data from exchange (always fresh since we size the order from it)
+        risk, status_code = _fetch_position_risk(force_refresh=True)
+        if risk is None:
+            return jsonify({'error': f'Failed to fetch position data: {status_code}', 'success': False}), status_code
 
-        positions = response.json()
         # Find the specific position
-        target_position = None
-        for pos in positions:
-            pos_symbol = pos['symbol']
-            position_amt = float(pos.get('positionAmt', 0))
-            pos_side = pos.get('positionSide', 'BOTH')
-
-            if pos_symbol == symbol and position_amt != 0:
-                # If we specified a specific side, try to match it
-                if side != 'BOTH':
-                    current_side = 'LONG' if position_amt > 0 else 'SHORT'
-                    if current_side == side:
-                        target_position = pos
-                        break
-                else:
-                    # For cases where side is 'BOTH' or fallback, take any position for this symbol
-                    target_position = pos
-                    break
-
+        target_position = _find_close_target(risk['by_key'], symbol, side)
         if not target_position:
             return jsonify({'error': f'No open position found for {symbol} {side}', 'success': False}), 404
 
@@ -337,44 +539,20 @@ def close_position(symbol, side):
         if position_amt == 0:
             return jsonify({'error': f'No position size for {symbol} {side}', 'success': False}), 400
 
-        # Determine the closing order side (opposite of position)
-        quantity = abs(position_amt)
-        current_side = 'LONG' if position_amt > 0 else 'SHORT'
-
-        if current_side == 'LONG':
-            order_side = 'SELL'
-        else:
-            order_side = 'BUY'
-
-        # Get the position side for the order
-        position_side = target_position.get('positionSide', 'BOTH')
-
         # Prepare market order to close the position
-        order_data = {
-            'symbol': symbol,
-            'side': order_side,
-            'type': 'MARKET',
-            'quantity': str(quantity),
-            'positionSide': position_side
-        }
-
-        # Only add reduceOnly in one-way mode (positionSide = BOTH)
-        if position_side == 'BOTH':
-            order_data['reduceOnly'] = 'true'
+        quantity = abs(position_amt)
+        order_data = _build_close_order(target_position)
+        order_side = order_data['side']
 
         # Check if we're in simulation mode
-        try:
-            from src.utils.config import config
-            if config.SIMULATE_ONLY:
-                # In simulation mode, just log the action
-                print(f"SIMULATE: Would close position for {symbol} {side} with quantity {quantity}")
-                return jsonify({
-                    'success': True,
-                    'message': f'Simulated closing {symbol} {side} position of {quantity} units',
-                    'simulated': True
-                })
-        except:
-            pass
+        if config.SIMULATE_ONLY:
+            # In simulation mode, just log the action
+            print(f"SIMULATE: Would close position for {symbol} {side} with quantity {quantity}")
+            return jsonify({
+                'success': True,
+                'message': f'Simulated closing {symbol} {side} position of {quantity} units',
+                'simulated': True
+            })
 
         # Place the market order to close the position
         order_response = make_authenticated_request('POST', f'https://fapi.asterdex.com/fapi/v1/order', data=order_data)
@@ -383,15 +561,8 @@ def close_position(symbol, side):
             order_result = order_response.json()
             order_id = str(order_result.get('orderId', 'unknown'))
 
-            # Log the successful close (similar to how orders are logged in trader.py)
-            try:
-                from src.database.db import insert_trade
-                db_conn = get_db_connection()
-                insert_trade(db_conn, symbol, order_id, order_side, quantity, 0, 'SUCCESS',
-                           order_result, 'MARKET', None, filled_qty=quantity, avg_price=order_result.get('avgPrice', 0))
-                db_conn.close()
-            except Exception as e:
-                print(f"Error logging close position trade: {e}")
+            # Log the successful close
+            _log_close_trade(order_data, order_result)
 
             return jsonify({
                 'success': True,
@@ -411,3 +582,95 @@ def close_position(symbol, side):
     except Exception as e:
         print(f"Error closing position {symbol} {side}: {e}")
         return jsonify({'error': f'Internal error: {str(e)}', 'success': False}), 500
+
+@position_bp.route('/api/positions/close_all', methods=['POST'])
+def close_all_positions():
+    """
+    Close several positions at once using batched market orders.
+
+    Expects a JSON body of either {"targets": [{"symbol": ..., "side": ...}]}
+    or {"all": true}; closing every open position must be asked for explicitly.
+    """
+    try:
+        targets, error = _parse_close_targets(request.get_json(silent=True))
+        if error:
+            return jsonify({'error': error, 'success': False}), 400
+
+        # Get current position data from exchange (always fresh since we size the orders from it)
+        risk, status_code = _fetch_position_risk(force_refresh=True)
+        if risk is None:
+            return jsonify({'error': f'Failed to fetch position data: {status_code}', 'success': False}), status_code
+
+        not_found = []
+        if targets is not None:
+            positions = {}
+            for symbol, side in targets:
+                position = _find_close_target(risk['by_key'], symbol, side)
+                if position:
+                    # Key by exchange position so duplicate targets don't close it twice
+                    positions[(position['symbol'], position.get('positionSide', 'BOTH'))] = position
+                else:
+                    not_found.append({'symbol': symbol, 'side': side})
+            positions = list(positions.values())
+        else:
+            positions = list(risk['by_key'].values())
+
+        if not positions:
+            return jsonify({'error': 'No open positions found to close', 'not_found': not_found, 'success': False}), 404
+
+        orders = [_build_close_order(position) for position in positions]
+
+        # Check if we're in simulation mode
+        if config.SIMULATE_ONLY:
+            # In simulation mode, just log the action
+            for order in orders:
+                print(f"SIMULATE: Would close position for {order['symbol']} {order['positionSide']} with quantity {order['quantity']}")
+            return jsonify({
+                'success': True,
+                'message': f'Simulated closing {len(orders)} positions',
+                'orders': orders,
+                'not_found': not_found,
+                'simulated': True
+            })
+
+        # Place the close orders in batches the exchange accepts
+        results = []
+        for i in range(0, len(orders), BATCH_ORDER_LIMIT):
+            batch = orders[i:i + BATCH_ORDER_LIMIT]
+            response = make_authenticated_request('POST', 'https://fapi.asterdex.com/fapi/v1/batchOrders',
+                                                  data={'batchOrders': json.dumps(batch)})
+
+            if response.status_code != 200:
+                results.extend({'symbol': order['symbol'], 'position_side': order['positionSide'],
+                                'success': False, 'error': response.text} for order in batch)
+                continue
+
+            # Results come back in the same order as the submitted batch
+            for order, order_result in zip(batch, response.json()):
+                if 'orderId' in order_result:
+                    _log_close_trade(order, order_result)
+                    results.append({
+                        'symbol': order['symbol'],
+                        'position_side': order['positionSide'],
+                        'success': True,
+                        'order_id': str(order_result['orderId']),
+                        'order_side': order['side'],
+                        'quantity': float(order['quantity'])
+                    })
+                else:
+                    results.append({
+                        'symbol': order['symbol'],
+                        'position_side': order['positionSide'],
+                        'success': False,
+                        'error': order_result.get('msg', str(order_result))
+                    })
+
+        return jsonify({
+            'success': all(result['success'] for result in results),
+            'results': results,
+            'not_found': not_found
+        })
+
+    except Exception as e:
+        print(f"Error closing positions: {e}")
+        return jsonify({'error': f'Internal error: {str(e)}', 'success': False}), 500
@@ -2,11 +2,54 @@
 Database service functions for the API server.
 """
 
+import queue
 import sqlite3
+from contextlib import contextmanager
 from src.api.config import DB_PATH
 
+# Maximum number of idle connections kept around for reuse by db_conn()
+POOL_SIZE = 8
+_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+
 def get_db_connection():
     """Get database connection."""
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     return conn
+
+def _open_pooled_connection():
+    """Open a connection configured for sharing across request threads."""
+    conn = sqlite3.connect(DB_PATH, timeout=30, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL;')
+    conn.execute('PRAGMA cache_size=-20000;')
+    return conn
+
+@contextmanager
+def db_conn():
+    """
+    Borrow a pooled database connection.
+
+    Connections stay open between requests so SQLite's page cache and
+    per-connection statement cache survive. Do not close the connection
+    yourself; it is returned to the pool when the block exits.
+
+    Usage:
+        with db_conn() as conn:
+            rows = conn.execute(...).fetchall()
+    """
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _open_pooled_connection()
+
+    try:
+        yield conn
+    finally:
+        # Never hand the next borrower an open transaction
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
@@ -141,12 +141,19 @@ def init_db(db_path):
     # Create indexes for faster queries
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_liquidations_symbol_timestamp ON liquidations (symbol, timestamp);')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_symbol_timestamp ON trades (symbol, timestamp);')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_symbol_side_timestamp ON trades (symbol, side, timestamp DESC);')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_parent_order ON trades (parent_order_id);')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_exchange_trade_id ON trades (exchange_trade_id);')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_relationships_main ON order_relationships (main_order_id);')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_relationships_symbol ON order_relationships (symbol);')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_status_symbol ON order_status (symbol);')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_status_status ON order_status (status);')
+    # Composite indexes backing the dashboard's position detail queries
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_relationships_symbol_side_tranche ON order_relationships (symbol, position_side, tranche_id, created_at DESC);')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_tranche_order_type ON trades (tranche_id, order_type);')
+
+    # Refresh planner statistics so the composite indexes get picked
+    cursor.execute('ANALYZE;')
 
     conn.commit()
     cursor.close()
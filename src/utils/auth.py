@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hmac
 import hashlib
 import time
@@ -12,11 +14,43 @@ from src.utils.endpoint_weights import get_endpoint_weight
 # Global rate limiter instance
 rate_limiter = RateLimiter(reserve_pct=0.2)
 
+# Maximum keep-alive connections kept open per host by the shared session
+HTTP_POOL_MAXSIZE = 20
+
+# Seconds to wait on the exchange when a caller doesn't pass its own timeout
+DEFAULT_HTTP_TIMEOUT = 10
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies DEFAULT_HTTP_TIMEOUT to requests sent without a timeout."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = DEFAULT_HTTP_TIMEOUT
+        return super().send(request, **kwargs)
+
+# Shared HTTP session so requests reuse keep-alive connections instead of
+# paying a TCP + TLS handshake each time. Only GETs are retried: a 503 from
+# the exchange means the execution status is unknown, so resending an order
+# (POST), modification (PUT) or cancel (DELETE) could act twice or report a
+# successful cancel as "Unknown order".
+session = requests.Session()
+session.mount('https://', TimeoutHTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({'GET'}),
+        raise_on_status=False
+    )
+))
+
 def create_signature(query_string, secret):
     """Create HMAC SHA256 signature."""
     return hmac.new(secret.encode('utf-8'), query_string.encode('utf-8'), hashlib.sha256).hexdigest()
 
-def make_authenticated_request(method, url, data=None, params=None):
+def make_authenticated_request(method, url, data=None, params=None, timeout=None):
     """Make an authenticated request using HMAC signature."""
     timestamp = int(time.time() * 1000)
 
@@ -61,7 +95,7 @@ def make_authenticated_request(method, url, data=None, params=None):
         params['signature'] = signature
 
         headers = {'X-MBX-APIKEY': config.API_KEY}
-        response = requests.get(url, headers=headers, params=params)
+        response = session.get(url, headers=headers, params=params, timeout=timeout)
 
     elif method.upper() == 'POST':
         if data is None:
@@ -78,7 +112,7 @@ def make_authenticated_request(method, url, data=None, params=None):
             'Content-Type': 'application/x-www-form-urlencoded'
         }
 
-        response = requests.post(url, headers=headers, data=data)
+        response = session.post(url, headers=headers, data=data, timeout=timeout)
 
     elif method.upper() == 'PUT':
         # PUT requests are similar to POST
@@ -96,7 +130,7 @@ def make_authenticated_request(method, url, data=None, params=None):
             'Content-Type': 'application/x-www-form-urlencoded'
         }
 
-        response = requests.put(url, headers=headers, data=data)
+        response = session.put(url, headers=headers, data=data, timeout=timeout)
 
     elif method.upper() == 'DELETE':
         # DELETE requests need parameters in URL query string, not body
@@ -114,7 +148,7 @@ def make_authenticated_request(method, url, data=None, params=None):
 
         headers = {'X-MBX-APIKEY': config.API_KEY}
 
-        response = requests.delete(url, headers=headers, params=params)
+        response = session.delete(url, headers=headers, params=params, timeout=timeout)
 
     else:
         raise ValueError(f"Unsupported method: {method}")
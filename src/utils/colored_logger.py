@@ -3,23 +3,62 @@ Colored logging system for enhanced console output.
 Provides color-coded log levels and special event formatting.
 """
 
+import collections
 import logging
 import sys
 import os
+import threading
+import time
 from datetime import datetime
-
-try:
-    from colorama import init, Fore, Back, Style
-
-    # Force color support on Windows
-    if sys.platform == "win32":
-        os.system("")  # Enables ANSI escape sequences on Windows
-
-    # Initialize colorama - always convert on Windows for compatibility
-    init(autoreset=True, convert=(sys.platform == "win32"))
-    COLORS_AVAILABLE = True
-except ImportError:
-    COLORS_AVAILABLE = False
+from logging.handlers import MemoryHandler
+
+# Log file location; derived from this file's path (src/utils/), so it never changes
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+_DATA_DIR = os.path.join(_REPO_ROOT, 'data')
+_LOG_FILE_PATH = os.path.join(_DATA_DIR, 'bot.log')
+
+
+def _enable_windows_ansi():
+    """Turn on ANSI escape processing for the Windows console. Returns True on success."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+def _stdout_is_tty():
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        # No stdout at all (e.g. pythonw) or it has been closed
+        return False
+
+
+# Colors are only useful on an interactive terminal; when output is
+# redirected to a file or pipe, skip colorama entirely and log plain tags
+COLORS_AVAILABLE = False
+if _stdout_is_tty():
+    try:
+        from colorama import Fore, Back, Style
+
+        # Unix terminals and Windows 10+ consoles with VT processing enabled
+        # render ANSI natively, so write escape codes straight through. Only
+        # older Windows consoles need colorama's converting stdout wrapper.
+        if sys.platform == "win32" and not _enable_windows_ansi():
+            from colorama import init
+            init(autoreset=True, convert=True)
+        COLORS_AVAILABLE = True
+    except ImportError:
+        pass
+
+if not COLORS_AVAILABLE:
     # Define dummy classes for fallback
     class Fore:
         BLACK = RED = GREEN = YELLOW = BLUE = MAGENTA = CYAN = WHITE = RESET = ''
@@ -86,8 +125,158 @@ SYMBOLS = {
     'DOT': '•',
 }
 
+# Bare-name aliases for the codes used when building messages
+_RESET = Style.RESET_ALL
+_C_DEBUG = COLOR_SCHEME['DEBUG']
+_C_INFO = COLOR_SCHEME['INFO']
+_C_SUCCESS = COLOR_SCHEME['SUCCESS']
+_C_WARNING = COLOR_SCHEME['WARNING']
+_C_ERROR = COLOR_SCHEME['ERROR']
+_C_CRITICAL = COLOR_SCHEME['CRITICAL']
+_C_TRADE_PLACED = COLOR_SCHEME['TRADE_PLACED']
+_C_TRADE_FILLED = COLOR_SCHEME['TRADE_FILLED']
+_C_TRADE_FAILED = COLOR_SCHEME['TRADE_FAILED']
+_C_TRADE_PROFIT = COLOR_SCHEME['TRADE_PROFIT']
+_C_TRADE_LOSS = COLOR_SCHEME['TRADE_LOSS']
+_C_LIQUIDATION = COLOR_SCHEME['LIQUIDATION']
+_C_LIQUIDATION_BIG = COLOR_SCHEME['LIQUIDATION_BIG']
+_C_THRESHOLD_MET = COLOR_SCHEME['THRESHOLD_MET']
+_C_TRANCHE_NEW = COLOR_SCHEME['TRANCHE_NEW']
+_C_TRANCHE_ADD = COLOR_SCHEME['TRANCHE_ADD']
+_C_TRANCHE_MERGE = COLOR_SCHEME['TRANCHE_MERGE']
+_C_TRANCHE_CLOSE = COLOR_SCHEME['TRANCHE_CLOSE']
+_C_POSITION_PROFIT = COLOR_SCHEME['POSITION_PROFIT']
+_C_POSITION_LOSS = COLOR_SCHEME['POSITION_LOSS']
+_C_STARTUP = COLOR_SCHEME['STARTUP']
+_C_SHUTDOWN = COLOR_SCHEME['SHUTDOWN']
+_S_SUCCESS = SYMBOLS['SUCCESS']
+_S_ERROR = SYMBOLS['ERROR']
+_S_WARNING = SYMBOLS['WARNING']
+_S_INFO = SYMBOLS['INFO']
+_S_TRADE = SYMBOLS['TRADE']
+_S_LOSS = SYMBOLS['LOSS']
+_S_PROFIT = SYMBOLS['PROFIT']
+_S_LIQUIDATION = SYMBOLS['LIQUIDATION']
+_S_TRANCHE = SYMBOLS['TRANCHE']
+_S_ARROW_UP = SYMBOLS['ARROW_UP']
+_S_ARROW_DOWN = SYMBOLS['ARROW_DOWN']
+_S_ARROW_RIGHT = SYMBOLS['ARROW_RIGHT']
+
+# Message decorations for the special event helpers, resolved once for this
+# platform. Windows gets ASCII-safe tags to avoid Unicode encode errors.
+_IS_WIN = sys.platform == "win32"
+_BAR = '=' * 50
+# Characters the Windows console can't encode, mapped to safe stand-ins
+_WIN_CONSOLE_TRANS = str.maketrans({'\u24c8': 'S'})  # Ⓢ
+
+if _IS_WIN:
+    def _sanitize(message):
+        """Clean up Unicode characters that can't be encoded in Windows console."""
+        if '\u24c8' in message:
+            return message.translate(_WIN_CONSOLE_TRANS)
+        return message
+else:
+    def _sanitize(message):
+        return message
+
+if COLORS_AVAILABLE and not _IS_WIN:
+    _END = _RESET
+    _P_SUCCESS = f"{_C_SUCCESS}{_S_SUCCESS} "
+    _P_TRADE_PLACED = f"{_C_TRADE_PLACED}{_S_TRADE} "
+    _P_TRADE_FILLED = f"{_C_TRADE_FILLED}{_S_SUCCESS} "
+    _P_TRADE_PROFIT = f"{_C_TRADE_PROFIT}{_S_PROFIT} "
+    _P_TRADE_LOSS = f"{_C_TRADE_LOSS}{_S_LOSS} "
+    _P_TRADE_FAILED = f"{_C_TRADE_FAILED}{_S_ERROR} "
+    _P_LIQUIDATION = _C_LIQUIDATION
+    _P_LIQUIDATION_BIG = f"{_C_LIQUIDATION_BIG}{_S_LIQUIDATION} BIG "
+    _P_THRESHOLD_MET = f"{_C_THRESHOLD_MET}{_S_SUCCESS} "
+    _P_TRANCHE_NEW = f"{_C_TRANCHE_NEW}{_S_TRANCHE} "
+    _P_TRANCHE_ADD = f"{_C_TRANCHE_ADD}{_S_TRANCHE} "
+    _P_TRANCHE_MERGE = f"{_C_TRANCHE_MERGE}{_S_TRANCHE} "
+    _P_TRANCHE_CLOSE = f"{_C_TRANCHE_CLOSE}{_S_TRANCHE} "
+    _P_TRANCHE_OTHER = f"{_C_INFO}{_S_TRANCHE} "
+    _P_POSITION_PROFIT = f"{_C_POSITION_PROFIT}{_S_ARROW_UP} "
+    _P_POSITION_LOSS = f"{_C_POSITION_LOSS}{_S_ARROW_DOWN} "
+    _P_POSITION_FLAT = f"{Fore.YELLOW}{_S_ARROW_RIGHT} "
+    _P_STARTUP = f"{_C_STARTUP}{_BAR}{_END}\n{_C_STARTUP}{_S_INFO} "
+    _E_STARTUP = f"{_END}\n{_C_STARTUP}{_BAR}{_END}"
+    _P_SHUTDOWN = f"{_C_SHUTDOWN}{_S_WARNING} "
+else:
+    _END = ''
+    _P_SUCCESS = "[SUCCESS] "
+    _P_TRADE_PLACED = "[TRADE] "
+    _P_TRADE_FILLED = _P_TRADE_PROFIT = _P_TRADE_LOSS = "[FILLED] "
+    _P_TRADE_FAILED = "[FAILED] "
+    _P_LIQUIDATION = "[LIQUIDATION] "
+    _P_LIQUIDATION_BIG = "[BIG LIQUIDATION] "
+    _P_THRESHOLD_MET = "[THRESHOLD MET] "
+    _P_TRANCHE_NEW = _P_TRANCHE_ADD = _P_TRANCHE_MERGE = _P_TRANCHE_CLOSE = _P_TRANCHE_OTHER = "[TRANCHE] "
+    _P_POSITION_PROFIT = "[PROFIT] "
+    _P_POSITION_LOSS = "[LOSS] "
+    _P_POSITION_FLAT = "[FLAT] "
+    _P_STARTUP = f"\n{_BAR}\n"
+    _E_STARTUP = f"\n{_BAR}"
+    _P_SHUTDOWN = "[WARNING] " if _IS_WIN else "[SHUTDOWN] "
+
+# Complete log formats for the fixed-layout events, with the decoration
+# baked in so a call only hands its fields to the logger
+_FMT_SUCCESS = f"{_P_SUCCESS}%s{_END}"
+_FMT_TRADE_PLACED = f"{_P_TRADE_PLACED}Order placed: %s %s %s @ %s{_END}"
+_TRADE_FILLED_BODY = "Order filled: %s %s %s @ %s"
+_FMT_TRADE_FILLED = f"{_P_TRADE_FILLED}{_TRADE_FILLED_BODY}{_END}"
+_FMT_TRADE_PROFIT = f"{_P_TRADE_PROFIT}{_TRADE_FILLED_BODY} | PNL: %+.2f{_END}"
+_FMT_TRADE_LOSS = f"{_P_TRADE_LOSS}{_TRADE_FILLED_BODY} | PNL: %+.2f{_END}"
+_FMT_TRADE_FAILED = f"{_P_TRADE_FAILED}Trade failed for %s: %s{_END}"
+_LIQUIDATION_BODY = "%s Liquidation: %s %s %s @ $%.4f ($%.2f)%s"
+_FMT_LIQUIDATION = f"{_P_LIQUIDATION}{_LIQUIDATION_BODY}{_END}"
+_FMT_LIQUIDATION_BIG = f"{_P_LIQUIDATION_BIG}{_LIQUIDATION_BODY}{_END}"
+_FMT_THRESHOLD_MET = f"{_P_THRESHOLD_MET}Volume threshold met for %s: $%.2f > $%.2f{_END}"
+_POSITION_BODY = "%s %s: %s @ %.4f | PNL: %+.2f%%"
+_FMT_POSITION_PROFIT = f"{_P_POSITION_PROFIT}{_POSITION_BODY}{_END}"
+_FMT_POSITION_LOSS = f"{_P_POSITION_LOSS}{_POSITION_BODY}{_END}"
+_FMT_POSITION_FLAT = f"{_P_POSITION_FLAT}{_POSITION_BODY}{_END}"
+_FMT_STARTUP = f"{_P_STARTUP}%s{_E_STARTUP}"
+_FMT_SHUTDOWN = f"{_P_SHUTDOWN}%s{_END}"
+
+
+def _tranche_formats(prefix, base_msg):
+    """Build the (without details, with details) log formats for a tranche event."""
+    fmt = f"{prefix}%(symbol)s: {base_msg}"
+    return fmt + _END, fmt + " - %(details)s" + _END
+
+
+# Tranche event type -> log formats, filled in from a mapping of
+# symbol/tranche_id/details at log time
+_TRANCHE_EVENTS = {
+    'new': _tranche_formats(_P_TRANCHE_NEW, "New tranche #%(tranche_id)s created"),
+    'add': _tranche_formats(_P_TRANCHE_ADD, "Adding to tranche #%(tranche_id)s"),
+    'merge': _tranche_formats(_P_TRANCHE_MERGE, "Merging tranches"),
+    'close': _tranche_formats(_P_TRANCHE_CLOSE, "Closing tranche #%(tranche_id)s"),
+}
+_TRANCHE_DEFAULT = _tranche_formats(_P_TRANCHE_OTHER, "Tranche event")
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records logged within the same second."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, '')
 
-class ColoredFormatter(logging.Formatter):
+    def formatTime(self, record, datefmt=None):
+        # Without a datefmt the default output includes milliseconds
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(datefmt, self.converter(second))
+            self._time_cache = (second, formatted)
+        return formatted
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter that adds colors to log output."""
 
     def __init__(self, *args, use_colors=True, **kwargs):
@@ -96,60 +285,140 @@ class ColoredFormatter(logging.Formatter):
 
         # Custom format strings for different log levels
         self.formats = {
-            'DEBUG': f"{COLOR_SCHEME['DEBUG']}%(asctime)s - DEBUG - %(message)s{Style.RESET_ALL}",
-            'INFO': f"%(asctime)s - {COLOR_SCHEME['INFO']}INFO{Style.RESET_ALL} - %(message)s",
-            'WARNING': f"%(asctime)s - {COLOR_SCHEME['WARNING']}WARNING{Style.RESET_ALL} - {COLOR_SCHEME['WARNING']}%(message)s{Style.RESET_ALL}",
-            'ERROR': f"%(asctime)s - {COLOR_SCHEME['ERROR']}ERROR{Style.RESET_ALL} - {COLOR_SCHEME['ERROR']}%(message)s{Style.RESET_ALL}",
-            'CRITICAL': f"{COLOR_SCHEME['CRITICAL']}%(asctime)s - CRITICAL - %(message)s{Style.RESET_ALL}",
+            'DEBUG': f"{_C_DEBUG}%(asctime)s - DEBUG - %(message)s{_RESET}",
+            'INFO': f"%(asctime)s - {_C_INFO}INFO{_RESET} - %(message)s",
+            'WARNING': f"%(asctime)s - {_C_WARNING}WARNING{_RESET} - {_C_WARNING}%(message)s{_RESET}",
+            'ERROR': f"%(asctime)s - {_C_ERROR}ERROR{_RESET} - {_C_ERROR}%(message)s{_RESET}",
+            'CRITICAL': f"{_C_CRITICAL}%(asctime)s - CRITICAL - %(message)s{_RESET}",
         }
 
-    def format(self, record):
+        # One pre-built style per level, so formatting a record never has to
+        # swap the format string on the shared formatter
+        self._styles = {}
         if self.use_colors:
-            # Get the format for this log level
-            log_fmt = self.formats.get(record.levelname, self._fmt)
-
-            # Temporarily set the format
-            original_fmt = self._fmt
-            self._fmt = log_fmt
-            self._style._fmt = log_fmt
-
+            self._styles = {level: logging.PercentStyle(fmt) for level, fmt in self.formats.items()}
+
+    def formatMessage(self, record):
+        return self._styles.get(record.levelname, self._style).format(record)
+
+
+class BufferedFileHandler(MemoryHandler):
+    """
+    Buffer records for a file handler and write them out in batches.
+
+    The buffer is written when it fills up, when an ERROR or worse arrives,
+    and at least every flush_interval seconds. Each batch goes to the file
+    in a single write instead of one write per record.
+    """
+
+    def __init__(self, target, capacity=512, flush_interval=1.0):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self._stop_flushing = threading.Event()
+        threading.Thread(
+            target=self._flush_periodically, args=(flush_interval,),
+            name='log-flush', daemon=True
+        ).start()
+
+    def _flush_periodically(self, interval):
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self.buffer or self.target is None:
+                return
+            target = self.target
+            with target.lock:
+                try:
+                    if target.stream is None:
+                        target.stream = target._open()
+                    target.stream.write(''.join(
+                        target.format(record) + target.terminator for record in self.buffer
+                    ))
+                    target.stream.flush()
+                except Exception:
+                    target.handleError(self.buffer[-1])
+            self.buffer.clear()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that batches writes to the stream during bursts.
+
+    A record is written straight away when nothing has been written for
+    flush_interval seconds, or when it is an ERROR or worse. Records that
+    arrive in between (e.g. during a liquidation cascade) are queued and
+    written together by a background flush every flush_interval seconds,
+    so a burst costs one write per interval instead of one per record
+    while paced output stays in order with print().
+    """
+
+    def __init__(self, stream=None, flush_interval=0.1, flush_level=logging.ERROR):
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._pending = collections.deque()
+        self._last_write = 0.0
+        self._stop_flushing = threading.Event()
+        threading.Thread(
+            target=self._flush_periodically, args=(flush_interval,),
+            name='console-log-flush', daemon=True
+        ).start()
+
+    def _flush_periodically(self, interval):
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+    def emit(self, record):
+        self._pending.append(record)
+        if (record.levelno >= self.flush_level
+                or time.monotonic() - self._last_write >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            lines = []
+            while self._pending:
+                record = self._pending.popleft()
+                try:
+                    lines.append(self.format(record) + self.terminator)
+                except Exception:
+                    self.handleError(record)
+            if not lines or not self.stream:
+                return
             try:
-                # Format the record
-                result = super().format(record)
-            except UnicodeEncodeError:
-                # Fall back to ASCII-safe formatting if Unicode fails
-                ascii_formats = {
-                    'DEBUG': '%(asctime)s - DEBUG - %(message)s',
-                    'INFO': '%(asctime)s - INFO - %(message)s',
-                    'WARNING': '%(asctime)s - [WARNING] - %(message)s',
-                    'ERROR': '%(asctime)s - [ERROR] - %(message)s',
-                    'CRITICAL': '%(asctime)s - [CRITICAL] - %(message)s',
-                }
-                ascii_fmt = ascii_formats.get(record.levelname, self._fmt)
-                self._fmt = ascii_fmt
-                self._style._fmt = ascii_fmt
-                result = super().format(record)
-
-            # Restore original format
-            self._fmt = original_fmt
-            self._style._fmt = original_fmt
-
-            return result
-        else:
-            return super().format(record)
-
-
-class ColoredLogger:
-    """Enhanced logger with color-coded output and special trading methods."""
-
-    def __init__(self, name=None, level=logging.INFO):
-        # Set up base logger
-        self.logger = logging.getLogger(name or __name__)
-        self.logger.setLevel(level)
-        self.logger.handlers.clear()
-
-        # Console handler with colors
-        console_handler = logging.StreamHandler(sys.stdout)
+                self.stream.write(''.join(lines))
+                self.stream.flush()
+            except Exception:
+                self.handleError(record)
+            self._last_write = time.monotonic()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+# Console and file handlers shared by every ColoredLogger, built on first use
+_shared_handlers_pair = None
+_shared_handlers_lock = threading.Lock()
+
+
+def _shared_handlers():
+    """Return the (console, file) handler pair, creating it on first call."""
+    global _shared_handlers_pair
+    with _shared_handlers_lock:
+        if _shared_handlers_pair is not None:
+            return _shared_handlers_pair
+
+        # Console handler with colors. Characters the Windows console code
+        # page can't encode are substituted rather than failing the write.
+        if _IS_WIN and hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(errors='replace')
+        console_handler = BufferedStreamHandler(sys.stdout)
         console_handler.setFormatter(
             ColoredFormatter(
                 '%(asctime)s - %(levelname)s - %(message)s',
@@ -157,44 +426,61 @@ class ColoredLogger:
                 use_colors=True
             )
         )
-        self.logger.addHandler(console_handler)
 
         # File handler without colors
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data')
-        os.makedirs(data_dir, exist_ok=True)
-        log_file_path = os.path.join(data_dir, 'bot.log')
-
-        file_handler = logging.FileHandler(log_file_path)
+        os.makedirs(_DATA_DIR, exist_ok=True)
+        file_handler = logging.FileHandler(_LOG_FILE_PATH)
         file_handler.setFormatter(
-            logging.Formatter(
+            CachedTimeFormatter(
                 '%(asctime)s - %(levelname)s - %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
         )
-        self.logger.addHandler(file_handler)
+
+        _shared_handlers_pair = (console_handler, BufferedFileHandler(file_handler))
+        return _shared_handlers_pair
+
+
+class ColoredLogger:
+    """Enhanced logger with color-coded output and special trading methods."""
+
+    def __init__(self, name=None, level=logging.INFO):
+        # Set up base logger
+        self.logger = logging.getLogger(name or __name__)
+        self.logger.setLevel(level)
+
+        # Reuse the shared handlers rather than opening bot.log again
+        handlers = list(_shared_handlers())
+        if self.logger.handlers != handlers:
+            self.logger.handlers.clear()
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+    def _emit(self, level, msg, *args):
+        """Hand a record straight to the logger's handlers; callers have already checked the level."""
+        logger = self.logger
+        logger.handle(logger.makeRecord(
+            logger.name, level, "(unknown file)", 0, msg, args, None, "(unknown function)"
+        ))
 
     # Standard logging methods
     def debug(self, message):
         self.logger.debug(message)
 
     def info(self, message):
-        # Clean up Unicode characters that can't be encoded in Windows console
-        if sys.platform == "win32":
-            message = message.replace('Ⓢ', 'S').replace('\u24c8', 'S')
-        self.logger.info(message)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(_sanitize(message))
 
     def warning(self, message):
-        # Clean up Unicode characters that can't be encoded in Windows console
-        if sys.platform == "win32":
-            message = message.replace('Ⓢ', 'S').replace('\u24c8', 'S')
-        self.logger.warning(message)
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        self.logger.warning(_sanitize(message))
 
     def error(self, message):
-        # Clean up Unicode characters that can't be encoded in Windows console
-        if sys.platform == "win32":
-            # Replace problematic Unicode characters
-            message = message.replace('Ⓢ', 'S').replace('\u24c8', 'S')
-        self.logger.error(message)
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        self.logger.error(_sanitize(message))
 
     def critical(self, message):
         self.logger.critical(message)
@@ -202,165 +488,109 @@ class ColoredLogger:
     # Special trading event methods
     def success(self, message):
         """Log a success message in green."""
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            self.logger.info(f"[SUCCESS] {message}")
-        elif COLORS_AVAILABLE:
-            self.logger.info(f"{COLOR_SCHEME['SUCCESS']}{SYMBOLS['SUCCESS']} {message}{Style.RESET_ALL}")
-        else:
-            self.logger.info(f"[SUCCESS] {message}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self._emit(logging.INFO, _FMT_SUCCESS, message)
 
     def trade_placed(self, symbol, side, qty, price):
         """Log a trade placement."""
-        message = f"Order placed: {symbol} {side} {qty} @ {price}"
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            self.logger.info(f"[TRADE] {message}")
-        elif COLORS_AVAILABLE:
-            self.logger.info(
-                f"{COLOR_SCHEME['TRADE_PLACED']}{SYMBOLS['TRADE']} {message}{Style.RESET_ALL}"
-            )
-        else:
-            self.logger.info(f"[TRADE] {message}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self._emit(logging.INFO, _FMT_TRADE_PLACED, symbol, side, qty, price)
 
     def trade_filled(self, symbol, side, qty, price, pnl=None):
         """Log a trade fill."""
-        message = f"Order filled: {symbol} {side} {qty} @ {price}"
-        if pnl is not None:
-            message += f" | PNL: {pnl:+.2f}"
-
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            self.logger.info(f"[FILLED] {message}")
-        elif COLORS_AVAILABLE:
-            color = COLOR_SCHEME['TRADE_PROFIT'] if pnl and pnl >= 0 else COLOR_SCHEME['TRADE_LOSS'] if pnl and pnl < 0 else COLOR_SCHEME['TRADE_FILLED']
-            symbol = SYMBOLS['PROFIT'] if pnl and pnl >= 0 else SYMBOLS['LOSS'] if pnl and pnl < 0 else SYMBOLS['SUCCESS']
-            self.logger.info(f"{color}{symbol} {message}{Style.RESET_ALL}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if pnl is None:
+            self._emit(logging.INFO, _FMT_TRADE_FILLED, symbol, side, qty, price)
         else:
-            self.logger.info(f"[FILLED] {message}")
+            fmt = _FMT_TRADE_PROFIT if pnl >= 0 else _FMT_TRADE_LOSS
+            self._emit(logging.INFO, fmt, symbol, side, qty, price, pnl)
 
     def trade_failed(self, symbol, reason):
         """Log a failed trade."""
-        message = f"Trade failed for {symbol}: {reason}"
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            self.logger.error(f"[FAILED] {message}")
-        elif COLORS_AVAILABLE:
-            self.logger.error(
-                f"{COLOR_SCHEME['TRADE_FAILED']}{SYMBOLS['ERROR']} {message}{Style.RESET_ALL}"
-            )
-        else:
-            self.logger.error(f"[FAILED] {message}")
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        self._emit(logging.ERROR, _FMT_TRADE_FAILED, symbol, reason)
 
     def liquidation(self, symbol, side, qty, price, usdt_value, volume_info=""):
         """Log a liquidation event."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         position_type = "Long" if side == "SELL" else "Short"
-        message = f"{position_type} Liquidation: {symbol} {side} {qty} @ ${price:.4f} (${usdt_value:.2f}){volume_info}"
 
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            log_type = "[BIG LIQUIDATION]" if usdt_value > 50000 else "[LIQUIDATION]"
-            self.logger.info(f"{log_type} {message}")
         # Big liquidation if > $50k
-        elif usdt_value > 50000:
-            if COLORS_AVAILABLE:
-                self.logger.info(
-                    f"{COLOR_SCHEME['LIQUIDATION_BIG']}{SYMBOLS['LIQUIDATION']} BIG {message}{Style.RESET_ALL}"
-                )
-            else:
-                self.logger.info(f"[BIG LIQUIDATION] {message}")
-        else:
-            if COLORS_AVAILABLE:
-                self.logger.info(
-                    f"{COLOR_SCHEME['LIQUIDATION']}{message}{Style.RESET_ALL}"
-                )
-            else:
-                self.logger.info(f"[LIQUIDATION] {message}")
+        fmt = _FMT_LIQUIDATION_BIG if usdt_value > 50000 else _FMT_LIQUIDATION
+        self._emit(
+            logging.INFO, fmt,
+            position_type, symbol, side, qty, price, usdt_value, volume_info
+        )
 
     def threshold_met(self, symbol, volume, threshold):
         """Log when volume threshold is met."""
-        message = f"Volume threshold met for {symbol}: ${volume:.2f} > ${threshold:.2f}"
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            self.logger.info(f"[THRESHOLD MET] {message}")
-        elif COLORS_AVAILABLE:
-            self.logger.info(
-                f"{COLOR_SCHEME['THRESHOLD_MET']}{SYMBOLS['SUCCESS']} {message}{Style.RESET_ALL}"
-            )
-        else:
-            self.logger.info(f"[THRESHOLD MET] {message}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self._emit(logging.INFO, _FMT_THRESHOLD_MET, symbol, volume, threshold)
 
     def tranche_event(self, event_type, symbol, tranche_id, details=""):
         """Log tranche-related events."""
-        event_types = {
-            'new': ('TRANCHE_NEW', f"New tranche #{tranche_id} created"),
-            'add': ('TRANCHE_ADD', f"Adding to tranche #{tranche_id}"),
-            'merge': ('TRANCHE_MERGE', f"Merging tranches"),
-            'close': ('TRANCHE_CLOSE', f"Closing tranche #{tranche_id}")
-        }
-
-        color_key, base_msg = event_types.get(event_type, ('INFO', f"Tranche event"))
-        message = f"{symbol}: {base_msg}"
-        if details:
-            message += f" - {details}"
-
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            self.logger.info(f"[TRANCHE] {message}")
-        elif COLORS_AVAILABLE:
-            self.logger.info(
-                f"{COLOR_SCHEME[color_key]}{SYMBOLS['TRANCHE']} {message}{Style.RESET_ALL}"
-            )
-        else:
-            self.logger.info(f"[TRANCHE] {message}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        plain_fmt, details_fmt = _TRANCHE_EVENTS.get(event_type, _TRANCHE_DEFAULT)
+        self._emit(
+            logging.INFO,
+            details_fmt if details else plain_fmt,
+            {'symbol': symbol, 'tranche_id': tranche_id, 'details': details}
+        )
 
     def position_update(self, symbol, side, qty, entry_price, current_pnl):
         """Log position updates with PNL coloring."""
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            status = "[PROFIT]" if current_pnl > 0 else "[LOSS]" if current_pnl < 0 else "[FLAT]"
-            message = f"{symbol} {side}: {qty} @ {entry_price:.4f} | PNL: {current_pnl:+.2f}%"
-            self.logger.info(f"{status} {message}")
-        else:
-            arrow = SYMBOLS['ARROW_UP'] if current_pnl > 0 else SYMBOLS['ARROW_DOWN'] if current_pnl < 0 else SYMBOLS['ARROW_RIGHT']
-            color = COLOR_SCHEME['POSITION_PROFIT'] if current_pnl > 0 else COLOR_SCHEME['POSITION_LOSS'] if current_pnl < 0 else Fore.YELLOW
-            message = f"{symbol} {side}: {qty} @ {entry_price:.4f} | PNL: {current_pnl:+.2f}%"
-
-            if COLORS_AVAILABLE:
-                self.logger.info(f"{color}{arrow} {message}{Style.RESET_ALL}")
-            else:
-                status = "PROFIT" if current_pnl > 0 else "LOSS" if current_pnl < 0 else "FLAT"
-                self.logger.info(f"[{status}] {message}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        fmt = _FMT_POSITION_PROFIT if current_pnl > 0 else _FMT_POSITION_LOSS if current_pnl < 0 else _FMT_POSITION_FLAT
+        self._emit(logging.INFO, fmt, symbol, side, qty, entry_price, current_pnl)
 
     def startup(self, message):
         """Log startup messages."""
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            self.logger.info(f"\n{'='*50}\n{message}\n{'='*50}")
-        elif COLORS_AVAILABLE:
-            self.logger.info(
-                f"{COLOR_SCHEME['STARTUP']}{'='*50}{Style.RESET_ALL}\n"
-                f"{COLOR_SCHEME['STARTUP']}{SYMBOLS['INFO']} {message}{Style.RESET_ALL}\n"
-                f"{COLOR_SCHEME['STARTUP']}{'='*50}{Style.RESET_ALL}"
-            )
-        else:
-            self.logger.info(f"\n{'='*50}\n{message}\n{'='*50}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self._emit(logging.INFO, _FMT_STARTUP, message)
 
     def shutdown(self, message):
         """Log shutdown messages."""
-        # Use ASCII-safe symbols on Windows to avoid Unicode encode errors
-        if sys.platform == "win32":
-            self.logger.info(f"[WARNING] {message}")
-        elif COLORS_AVAILABLE:
-            self.logger.info(
-                f"{COLOR_SCHEME['SHUTDOWN']}{SYMBOLS['WARNING']} {message}{Style.RESET_ALL}"
-            )
-        else:
-            self.logger.info(f"[SHUTDOWN] {message}")
-
-
-# Create global colored logger instance
-colored_log = ColoredLogger("AsterBot")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self._emit(logging.INFO, _FMT_SHUTDOWN, message)
+
+class _LazyColoredLogger:
+    """
+    Stand-in for a ColoredLogger that is only built on first use.
+
+    Importing this module then doesn't create the data directory, open
+    bot.log or start the flush threads until something actually logs.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def _resolve(self):
+        with self._lock:
+            if self._instance is None:
+                self._instance = ColoredLogger(self._name)
+            return self._instance
+
+    def __getattr__(self, attr):
+        value = getattr(self._resolve(), attr)
+        # Keep it on the proxy so later lookups don't come through here again
+        setattr(self, attr, value)
+        return value
+
+
+# Global colored logger instance, created lazily on first use
+colored_log = _LazyColoredLogger("AsterBot")
 
 # For backward compatibility
 log = colored_log
@@ -0,0 +1,137 @@
+"""
+Tests for the buffered console and file log handlers.
+"""
+
+import logging
+import os
+import tempfile
+import time
+import unittest
+import weakref
+
+from src.utils.colored_logger import BufferedFileHandler, BufferedStreamHandler
+
+
+class RecordingStream:
+    """Stream that keeps every write call separately."""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+
+    def flush(self):
+        pass
+
+
+def make_record(msg, level=logging.INFO):
+    return logging.makeLogRecord({'msg': msg, 'levelno': level, 'levelname': logging.getLevelName(level)})
+
+
+class TestBufferedStreamHandler(unittest.TestCase):
+    """Test suite for BufferedStreamHandler."""
+
+    def make_handler(self, flush_interval=60):
+        self.stream = RecordingStream()
+        handler = BufferedStreamHandler(self.stream, flush_interval=flush_interval)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self.addCleanup(handler.close)
+        return handler
+
+    def test_first_record_is_written_immediately(self):
+        handler = self.make_handler()
+        handler.emit(make_record('first'))
+        self.assertEqual(self.stream.writes, ['first\n'])
+
+    def test_error_flushes_pending_records(self):
+        handler = self.make_handler()
+        handler.emit(make_record('first'))
+        handler.emit(make_record('queued'))
+        self.assertEqual(self.stream.writes, ['first\n'])
+
+        handler.emit(make_record('boom', logging.ERROR))
+        self.assertEqual(self.stream.writes, ['first\n', 'queued\nboom\n'])
+
+    def test_burst_is_written_in_order_in_one_write(self):
+        handler = self.make_handler()
+        handler.emit(make_record('first'))
+        for i in range(50):
+            handler.emit(make_record(f'burst {i}'))
+        self.assertEqual(len(self.stream.writes), 1)
+
+        handler.flush()
+        self.assertEqual(len(self.stream.writes), 2)
+        self.assertEqual(self.stream.writes[1], ''.join(f'burst {i}\n' for i in range(50)))
+
+    def test_interval_flush_writes_queued_records(self):
+        handler = self.make_handler(flush_interval=0.05)
+        handler.emit(make_record('first'))
+        handler.emit(make_record('queued'))
+
+        deadline = time.monotonic() + 2
+        while len(self.stream.writes) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.stream.writes, ['first\n', 'queued\n'])
+
+    def test_shutdown_drains_pending_records(self):
+        handler = self.make_handler()
+        handler.emit(make_record('first'))
+        handler.emit(make_record('queued'))
+
+        logging.shutdown([weakref.ref(handler)])
+        self.assertEqual(self.stream.writes, ['first\n', 'queued\n'])
+
+
+class TestBufferedFileHandler(unittest.TestCase):
+    """Test suite for BufferedFileHandler."""
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, 'bot.log')
+
+        self.target = logging.FileHandler(self.path, delay=True)
+        self.target.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        self.addCleanup(self.target.close)
+
+        self.handler = BufferedFileHandler(self.target, flush_interval=60)
+        self.addCleanup(self.handler.close)
+
+    def read_log(self):
+        if not os.path.exists(self.path):
+            return ''
+        with open(self.path) as f:
+            return f.read()
+
+    def test_records_are_buffered_then_written_as_a_batch(self):
+        for i in range(3):
+            self.handler.handle(make_record(f'line {i}'))
+        self.assertEqual(self.read_log(), '')
+
+        self.handler.flush()
+        self.assertEqual(self.read_log(), 'INFO line 0\nINFO line 1\nINFO line 2\n')
+
+    def test_batch_goes_out_in_a_single_write(self):
+        self.target.stream = stream = RecordingStream()
+        for i in range(4):
+            self.handler.handle(make_record(f'line {i}'))
+
+        self.handler.flush()
+        self.assertEqual(stream.writes, ['INFO line 0\nINFO line 1\nINFO line 2\nINFO line 3\n'])
+        self.target.stream = None
+
+    def test_error_is_written_immediately(self):
+        self.handler.handle(make_record('queued'))
+        self.handler.handle(make_record('boom', logging.ERROR))
+        self.assertEqual(self.read_log(), 'INFO queued\nERROR boom\n')
+
+    def test_close_drains_buffer(self):
+        self.handler.handle(make_record('queued'))
+
+        logging.shutdown([weakref.ref(self.handler)])
+        self.assertEqual(self.read_log(), 'INFO queued\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Tests for the POST /api/positions/close_all endpoint.
+"""
+
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from src.api.routes import position_routes
+from src.api.routes.position_routes import position_bp
+
+
+def make_response(status_code, payload):
+    """Build a fake requests response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.text = json.dumps(payload)
+    return response
+
+
+def position(symbol, amount, side='BOTH'):
+    """Build a positionRisk entry."""
+    return {'symbol': symbol, 'positionAmt': str(amount), 'positionSide': side,
+            'entryPrice': '100', 'markPrice': '100', 'unRealizedProfit': '0'}
+
+
+class TestCloseAllPositions(unittest.TestCase):
+    """Test suite for batched position closing."""
+
+    def setUp(self):
+        app = Flask(__name__)
+        app.register_blueprint(position_bp)
+        self.client = app.test_client()
+
+        self.positions = []
+        self.batch_results = None
+        self.batches = []
+
+        position_routes._position_risk_cache.update(risk=None, expires_at=0)
+
+        patches = [
+            patch.object(position_routes, 'make_authenticated_request', side_effect=self.fake_request),
+            patch.object(position_routes, '_log_close_trade'),
+            patch.object(position_routes, 'config', MagicMock(SIMULATE_ONLY=False)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def fake_request(self, method, url, data=None, params=None, timeout=None):
+        if url.endswith('/fapi/v2/positionRisk'):
+            return make_response(200, self.positions)
+        if url.endswith('/fapi/v1/batchOrders'):
+            batch = json.loads(data['batchOrders'])
+            self.batches.append(batch)
+            if self.batch_results is not None:
+                return make_response(200, self.batch_results.pop(0))
+            return make_response(200, [{'orderId': 1000 + len(self.batches) * 10 + i}
+                                       for i in range(len(batch))])
+        raise AssertionError(f'Unexpected request {method} {url}')
+
+    def close_all(self, body=None):
+        if body is None:
+            return self.client.post('/api/positions/close_all')
+        return self.client.post('/api/positions/close_all', json=body)
+
+    def test_missing_body_is_rejected(self):
+        self.positions = [position('BTCUSDT', 0.01)]
+        response = self.close_all()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.batches, [])
+
+    def test_empty_targets_is_rejected(self):
+        self.positions = [position('BTCUSDT', 0.01)]
+        response = self.close_all({'targets': []})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.batches, [])
+
+    def test_malformed_targets_are_rejected(self):
+        for body in ({'targets': 'BTCUSDT'}, {'targets': ['BTCUSDT']},
+                     {'targets': [{'symbol': 'BTCUSDT'}]},
+                     {'targets': [{'symbol': 'BTCUSDT', 'side': 'UP'}]},
+                     {'all': 'yes'}, {'all': True, 'targets': []}):
+            with self.subTest(body=body):
+                response = self.close_all(body)
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.batches, [])
+
+    def test_all_closes_every_position(self):
+        self.positions = [position('BTCUSDT', 0.01), position('ETHUSDT', -0.5)]
+        response = self.close_all({'all': True})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.get_json()['success'])
+        orders = self.batches[0]
+        self.assertEqual([(o['symbol'], o['side']) for o in orders],
+                         [('BTCUSDT', 'SELL'), ('ETHUSDT', 'BUY')])
+        self.assertTrue(all(o['reduceOnly'] == 'true' for o in orders))
+
+    def test_one_way_position_matches_requested_direction(self):
+        self.positions = [position('BTCUSDT', 0.01), position('ETHUSDT', -0.5)]
+        response = self.close_all({'targets': [
+            {'symbol': 'BTCUSDT', 'side': 'LONG'},
+            {'symbol': 'ETHUSDT', 'side': 'LONG'},
+        ]})
+        body = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([o['symbol'] for o in self.batches[0]], ['BTCUSDT'])
+        self.assertEqual(self.batches[0][0]['positionSide'], 'BOTH')
+        self.assertEqual(body['not_found'], [{'symbol': 'ETHUSDT', 'side': 'LONG'}])
+
+    def test_duplicate_targets_close_once(self):
+        self.positions = [position('BTCUSDT', 0.01)]
+        response = self.close_all({'targets': [
+            {'symbol': 'BTCUSDT', 'side': 'LONG'},
+            {'symbol': 'BTCUSDT', 'side': 'BOTH'},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(len(self.batches[0]), 1)
+        self.assertEqual(len(response.get_json()['results']), 1)
+
+    def test_orders_are_split_into_batches(self):
+        self.positions = [position(f'SYM{i}USDT', 1, 'LONG') for i in range(7)]
+        response = self.close_all({'all': True})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([len(batch) for batch in self.batches], [5, 2])
+        results = response.get_json()['results']
+        self.assertEqual([r['symbol'] for r in results], [f'SYM{i}USDT' for i in range(7)])
+        self.assertTrue(all(r['success'] for r in results))
+        self.assertNotIn('reduceOnly', self.batches[0][0])
+
+    def test_per_order_error_is_reported(self):
+        self.positions = [position('BTCUSDT', 0.01), position('ETHUSDT', -0.5)]
+        self.batch_results = [[{'orderId': 42}, {'code': -2022, 'msg': 'ReduceOnly Order is rejected.'}]]
+        response = self.close_all({'all': True})
+        body = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(body['success'])
+        self.assertTrue(body['results'][0]['success'])
+        self.assertEqual(body['results'][0]['order_id'], '42')
+        self.assertFalse(body['results'][1]['success'])
+        self.assertEqual(body['results'][1]['error'], 'ReduceOnly Order is rejected.')
+        position_routes._log_close_trade.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()